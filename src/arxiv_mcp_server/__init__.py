@@ -8,6 +8,15 @@ import asyncio
 
 def main():
     """Main entry point for the package."""
+    # Use uvloop when available for lower event-loop overhead; it is an
+    # optional dependency and unsupported on Windows, so fall back silently.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(server.main())
 
 
@@ -1,6 +1,7 @@
 """Configuration settings for the arXiv MCP server."""
 
 import sys
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 import logging
@@ -8,6 +9,55 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> "Settings":
+    """Return the shared Settings instance.
+
+    Settings are immutable at runtime, so every module shares one instance
+    instead of re-running pydantic's env parsing on import.
+    """
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def _parse_storage_path(args: tuple[str, ...]) -> Path | None:
+    """Parse the --storage-path option from command line arguments.
+
+    Cached on the argument tuple so repeated STORAGE_PATH accesses do not
+    rescan an unchanged command line.
+
+    Returns:
+        Path | None: The storage path if specified in arguments, None otherwise.
+    """
+    # If not enough arguments
+    if len(args) < 2:
+        return None
+
+    # Look for the --storage-path option
+    try:
+        storage_path_index = args.index("--storage-path")
+    except ValueError:
+        return None
+
+    # Early return if --storage-path is the last argument
+    if storage_path_index + 1 >= len(args):
+        return None
+
+    # Try to resolve the path
+    try:
+        path = Path(args[storage_path_index + 1])
+        return path.resolve()
+    except (TypeError, ValueError) as e:
+        # TypeError: If the path argument is not string-like
+        # ValueError: If the path string is malformed
+        logger.warning("Invalid storage path format: %s", e)
+    except OSError as e:
+        # OSError: If the path contains invalid characters or is too long
+        logger.warning("Invalid storage path: %s", e)
+
+    return None
+
+
 class Settings(BaseSettings):
     """Server configuration settings."""
 
@@ -41,32 +91,4 @@ class Settings(BaseSettings):
         Returns:
             Path | None: The storage path if specified in arguments, None otherwise.
         """
-        args = sys.argv[1:]
-
-        # If not enough arguments
-        if len(args) < 2:
-            return None
-
-        # Look for the --storage-path option
-        try:
-            storage_path_index = args.index("--storage-path")
-        except ValueError:
-            return None
-
-        # Early return if --storage-path is the last argument
-        if storage_path_index + 1 >= len(args):
-            return None
-
-        # Try to resolve the path
-        try:
-            path = Path(args[storage_path_index + 1])
-            return path.resolve()
-        except (TypeError, ValueError) as e:
-            # TypeError: If the path argument is not string-like
-            # ValueError: If the path string is malformed
-            logger.warning(f"Invalid storage path format: {e}")
-        except OSError as e:
-            # OSError: If the path contains invalid characters or is too long
-            logger.warning(f"Invalid storage path: {e}")
-
-        return None
+        return _parse_storage_path(tuple(sys.argv[1:]))
@@ -6,6 +6,11 @@ from .prompts import PROMPTS
 from .deep_research_analysis_prompt import PAPER_ANALYSIS_PROMPT
 
 
+# Maximum number of papers remembered by the global research context; older
+# entries are evicted so a long-running server does not grow without bound.
+MAX_CONTEXT_PAPERS = 200
+
+
 # Legacy global research context - used as fallback when no session_id is provided
 class ResearchContext:
     """Maintains context throughout a research session."""
@@ -21,6 +26,14 @@ class ResearchContext:
             self.expertise_level = args["expertise_level"]
         if "paper_id" in args and args["paper_id"] not in self.explored_papers:
             self.explored_papers[args["paper_id"]] = {"id": args["paper_id"]}
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest tracked papers once the context is over capacity."""
+        while len(self.explored_papers) > MAX_CONTEXT_PAPERS:
+            oldest = next(iter(self.explored_papers))
+            del self.explored_papers[oldest]
+            self.paper_analyses.pop(oldest, None)
 
 
 # Global research context for backward compatibility
@@ -36,11 +49,21 @@ Present your analysis with the following structure:
 5. Implementation Notes: Practical considerations for applying these findings
 """
 
+# Static tail of every analysis prompt, assembled once at import time so
+# get_prompt only has to join in the per-call pieces.
+_STATIC_TAIL = f"\n\n{OUTPUT_STRUCTURE}\n\n{PAPER_ANALYSIS_PROMPT}"
+
+
+# Only deep-paper-analysis is exposed; compute the listing once at import
+# instead of re-filtering PROMPTS on every prompts/list request.
+_LISTED_PROMPTS = tuple(
+    [PROMPTS["deep-paper-analysis"]] if "deep-paper-analysis" in PROMPTS else []
+)
+
 
 async def list_prompts() -> List[Prompt]:
     """Handle prompts/list request."""
-    # Filter to only include deep-paper-analysis
-    return [PROMPTS["deep-paper-analysis"]] if "deep-paper-analysis" in PROMPTS else []
+    return list(_LISTED_PROMPTS)
 
 
 async def get_prompt(
@@ -80,13 +103,12 @@ async def get_prompt(
     # Add context from previous papers if available
     previous_papers_context = ""
 
-    # Use global context
+    # Use global context; the keys-view difference runs in C rather than a
+    # Python-level filtering loop.
     if len(_research_context.explored_papers) > 1:
-        previous_ids = [
-            pid for pid in _research_context.explored_papers.keys() if pid != paper_id
-        ]
+        previous_ids = _research_context.explored_papers.keys() - {paper_id}
         if previous_ids:
-            previous_papers_context = f"\nI've previously analyzed papers: {', '.join(previous_ids)}. If relevant, note connections to these works."
+            previous_papers_context = f"\nI've previously analyzed papers: {', '.join(sorted(previous_ids))}. If relevant, note connections to these works."
 
     # Track this analysis in context (for global context only)
     _research_context.paper_analyses[paper_id] = {"analysis": "complete"}
@@ -97,7 +119,15 @@ async def get_prompt(
                 role="user",
                 content=TextContent(
                     type="text",
-                    text=f"Analyze paper {paper_id}.{previous_papers_context}\n\n{OUTPUT_STRUCTURE}\n\n{PAPER_ANALYSIS_PROMPT}",
+                    text="".join(
+                        (
+                            "Analyze paper ",
+                            paper_id,
+                            ".",
+                            previous_papers_context,
+                            _STATIC_TAIL,
+                        )
+                    ),
                 ),
             )
         ]
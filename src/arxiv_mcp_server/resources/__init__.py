@@ -1,5 +1,5 @@
 """Resource management for the arXiv MCP server."""
 
-from .papers import PaperManager
+from .papers import PaperManager, get_paper_manager
 
-__all__ = ["PaperManager"]
+__all__ = ["PaperManager", "get_paper_manager"]
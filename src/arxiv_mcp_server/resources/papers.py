@@ -1,53 +1,175 @@
 """Resource management and storage for arXiv papers."""
 
+import asyncio
+import os
+import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+import aiohttp
 import arxiv
-import pymupdf4llm
 import aiofiles
 import logging
 from pydantic import AnyUrl
 import mcp.types as types
-from ..config import Settings
+from ..config import get_settings
 
 logger = logging.getLogger("arxiv-mcp-server")
 
+# The arXiv API accepts multi-ID lookups but caps the id_list length.
+MAX_ID_BATCH = 300
+
+# 128 KiB chunks keep streaming downloads efficient without large buffers.
+DOWNLOAD_CHUNK_SIZE = 131072
+
+# Cap simultaneous PDF downloads; arXiv asks clients to stay polite, and a
+# bursty MCP client should not be able to fan out unbounded requests.
+MAX_CONCURRENT_DOWNLOADS = 4
+
+_download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+# Trailing version suffix on arXiv IDs (e.g. the v2 in 2103.12345v2).
+_VERSION_SUFFIX_RE = re.compile(r"v\d+$")
+
+_manager: Optional["PaperManager"] = None
+
+
+def get_paper_manager() -> "PaperManager":
+    """Return the shared PaperManager, creating it on first use.
+
+    Constructing one per request would discard the in-flight dedup maps and
+    the listing cache every time; callers should go through this accessor.
+    """
+    global _manager
+    if _manager is None:
+        _manager = PaperManager()
+    return _manager
+
 
 class PaperManager:
     """Manages the storage, retrieval, and resource handling of arXiv papers."""
 
+    # Shared across instances so every download reuses one connection pool
+    # instead of paying a TCP+TLS handshake per paper.
+    _session: Optional[aiohttp.ClientSession] = None
+
     def __init__(self):
         """Initialize the paper management system."""
-        settings = Settings()
+        settings = get_settings()
         self.storage_path = Path(settings.STORAGE_PATH)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.client = arxiv.Client()
+        self._inflight_reads: dict[str, asyncio.Task] = {}
+        self._inflight_stores: dict[str, asyncio.Task] = {}
+        self._list_cache: Optional[tuple[int, list[str]]] = None
 
     def _get_paper_path(self, paper_id: str) -> Path:
         """Get the absolute file path for a paper."""
         return self.storage_path / f"{paper_id}.md"
 
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=8, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=get_settings().REQUEST_TIMEOUT),
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP session on server shutdown."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    def _pop_inflight(
+        self, inflight: dict[str, asyncio.Task], paper_id: str
+    ) -> callable:
+        """Build a done-callback that removes a finished in-flight task.
+
+        Also marks a failed task's exception as retrieved, since every
+        waiter may have been cancelled before collecting it.
+        """
+
+        def _done(task: asyncio.Task) -> None:
+            inflight.pop(paper_id, None)
+            if not task.cancelled():
+                task.exception()
+
+        return _done
+
     async def store_paper(self, paper_id: str, pdf_url: str) -> bool:
-        """Download and store a paper from arXiv."""
-        paper_md_path = self._get_paper_path(paper_id)
-        paper_pdf_path = paper_md_path.with_suffix(".pdf")
+        """Download and store a paper from arXiv.
 
-        if paper_md_path.exists():
+        Concurrent calls for the same paper share one download instead of
+        racing each other onto the same output file. The store runs in its
+        own task so one caller being cancelled neither kills the download
+        the others share nor strands them on an unresolved future.
+        """
+        if self._get_paper_path(paper_id).exists():
             return True
 
+        task = self._inflight_stores.get(paper_id)
+        if task is None:
+            task = asyncio.create_task(self._store_paper(paper_id, pdf_url))
+            self._inflight_stores[paper_id] = task
+            task.add_done_callback(self._pop_inflight(self._inflight_stores, paper_id))
+        return await asyncio.shield(task)
+
+    async def _store_paper(self, paper_id: str, pdf_url: str) -> bool:
+        """Download a paper's PDF and store its markdown conversion."""
+        # Imported lazily: pymupdf4llm pulls in PyMuPDF, which dominates
+        # module import time and is only needed once a paper is stored.
+        import pymupdf4llm
+
+        paper_md_path = self._get_paper_path(paper_id)
+        paper_pdf_path = paper_md_path.with_suffix(".pdf")
+
         try:
-            paper = next(self.client.results(arxiv.Search(id_list=[paper_id])))
-            paper.download_pdf(dirpath=self.storage_path, filename=paper_pdf_path)
-            markdown = pymupdf4llm.to_markdown(paper_pdf_path, show_progress=False)
+            session = self._get_session()
+            async with _download_semaphore:
+                async with session.get(pdf_url) as response:
+                    response.raise_for_status()
+                    # Stream to disk in chunks so large PDFs are never fully
+                    # buffered in memory and writes overlap the download.
+                    try:
+                        async with aiofiles.open(paper_pdf_path, "wb") as f:
+                            async for chunk in response.content.iter_chunked(
+                                DOWNLOAD_CHUNK_SIZE
+                            ):
+                                await f.write(chunk)
+                    except BaseException:
+                        paper_pdf_path.unlink(missing_ok=True)
+                        raise
+
+            # PDF parsing is CPU-heavy and MuPDF releases the GIL, so run it
+            # in a thread rather than blocking the event loop for seconds.
+            markdown = await asyncio.to_thread(
+                pymupdf4llm.to_markdown, paper_pdf_path, show_progress=False
+            )
 
-            async with aiofiles.open(paper_md_path, "w", encoding="utf-8") as f:
-                await f.write(markdown)
+            # One-shot write of a complete buffer: a single to_thread call is
+            # cheaper than aiofiles' separate open/write/close thread hops.
+            # Write to a temp name and rename so readers never see a partial
+            # markdown file.
+            await asyncio.to_thread(
+                self._write_markdown_atomic, paper_md_path, markdown
+            )
+
+            # The PDF was only needed as conversion input; drop it so the
+            # storage directory holds markdown only.
+            paper_pdf_path.unlink(missing_ok=True)
+
+            # Invalidate the listing cache so the new paper shows up even if
+            # the directory mtime has not ticked yet.
+            self._list_cache = None
 
             return True
 
-        except StopIteration:
-            raise ValueError(f"Paper with ID {paper_id} not found on arXiv.")
-        except arxiv.ArxivError as e:
+        except aiohttp.ClientError as e:
             raise ValueError(
                 f"Error: Failed to download paper {paper_id} from arXiv. Details: {str(e)}"
             )
@@ -56,28 +178,74 @@ class PaperManager:
                 f"Error: An unexpected error occurred while storing paper {paper_id}. Details: {str(e)}"
             )
 
+    @staticmethod
+    def _write_markdown_atomic(paper_md_path: Path, markdown: str) -> None:
+        """Write markdown to a temporary file and atomically rename it."""
+        tmp_path = paper_md_path.with_suffix(".md.tmp")
+        tmp_path.write_text(markdown, encoding="utf-8")
+        os.replace(tmp_path, paper_md_path)
+
     async def has_paper(self, paper_id: str) -> bool:
         """Check if a paper is available in storage."""
         return self._get_paper_path(paper_id).exists()
 
     async def list_papers(self) -> list[str]:
-        """List all stored paper IDs."""
-        logger.info(f"Listing papers in {self.storage_path}")
-        paper_ids = [p.stem for p in self.storage_path.glob("*.md")]
-        logger.info(f"Found {len(paper_ids)} papers")
-        return paper_ids
+        """List all stored paper IDs.
+
+        The directory scan is memoized on the storage directory's mtime, so
+        repeated listings cost a single stat() until a paper is added or
+        removed.
+        """
+        mtime = self.storage_path.stat().st_mtime_ns
+        if self._list_cache is not None and self._list_cache[0] == mtime:
+            return list(self._list_cache[1])
+
+        logger.info("Listing papers in %s", self.storage_path)
+        # os.scandir avoids the per-entry Path construction and Python-level
+        # fnmatch that Path.glob pays.
+        paper_ids = [
+            entry.name[:-3]
+            for entry in os.scandir(self.storage_path)
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
+        logger.info("Found %d papers", len(paper_ids))
+        self._list_cache = (mtime, paper_ids)
+        return list(paper_ids)
+
+    def _fetch_papers(self, paper_ids: List[str]) -> List[arxiv.Result]:
+        """Fetch metadata for a batch of paper IDs in a single API call."""
+        search = arxiv.Search(id_list=paper_ids, max_results=len(paper_ids))
+        return list(self.client.results(search))
 
     async def list_resources(self) -> List[types.Resource]:
         """List all papers as MCP resources with metadata."""
         paper_ids = await self.list_papers()
-        resources = []
+        if not paper_ids:
+            return []
 
-        for paper_id in paper_ids:
-            search = arxiv.Search(id_list=[paper_id])
-            papers = list(self.client.results(search))
+        # Batch the metadata lookups instead of one request per paper, and
+        # run them off the event loop since the arxiv client is blocking.
+        batches = [
+            paper_ids[i : i + MAX_ID_BATCH]
+            for i in range(0, len(paper_ids), MAX_ID_BATCH)
+        ]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_papers, batch) for batch in batches)
+        )
+        # get_short_id() carries the version suffix (2103.12345v2) while
+        # stored filenames are typically versionless; index both forms so
+        # the merge below finds the paper either way.
+        papers_by_id = {}
+        for batch in results:
+            for paper in batch:
+                short_id = paper.get_short_id()
+                papers_by_id[short_id] = paper
+                papers_by_id.setdefault(_VERSION_SUFFIX_RE.sub("", short_id), paper)
 
-            if papers:
-                paper = papers[0]
+        resources = []
+        for paper_id in paper_ids:
+            paper = papers_by_id.get(paper_id)
+            if paper:
                 paper_path = self._get_paper_path(paper_id)
                 resources.append(
                     types.Resource(
@@ -88,14 +256,29 @@ class PaperManager:
                     )
                 )
 
-        logger.info(f"Found {len(resources)} resources")
+        logger.info("Found %d resources", len(resources))
         return resources
 
-    async def get_paper_content(self, paper_id: str) -> str:
-        """Get the markdown content of a stored paper."""
+    async def _read_paper_content(self, paper_id: str) -> str:
+        """Read a stored paper's markdown from disk."""
         paper_path = self._get_paper_path(paper_id)
         if not paper_path.exists():
             raise ValueError(f"Paper {paper_id} not found in storage")
 
         async with aiofiles.open(paper_path, "r", encoding="utf-8") as f:
             return await f.read()
+
+    async def get_paper_content(self, paper_id: str) -> str:
+        """Get the markdown content of a stored paper.
+
+        Concurrent requests for the same paper coalesce onto one read
+        instead of each opening the file independently. The read runs in
+        its own task so one caller being cancelled cannot strand the
+        others on an unresolved future.
+        """
+        task = self._inflight_reads.get(paper_id)
+        if task is None:
+            task = asyncio.create_task(self._read_paper_content(paper_id))
+            self._inflight_reads[paper_id] = task
+            task.add_done_callback(self._pop_inflight(self._inflight_reads, paper_id))
+        return await asyncio.shield(task)
@@ -12,17 +12,24 @@ from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions
 from mcp.server.stdio import stdio_server
-from .config import Settings
+from .config import get_settings
 from .tools import handle_search, handle_list_papers, handle_read_paper
 from .tools import search_tool, list_tool, read_tool
 from .prompts.handlers import list_prompts as handler_list_prompts
 from .prompts.handlers import get_prompt as handler_get_prompt
 
-settings = Settings()
+settings = get_settings()
 logger = logging.getLogger("arxiv-mcp-server")
 logger.setLevel(logging.INFO)
 server = Server(settings.APP_NAME)
 
+# Tool dispatch table: one hash lookup per call instead of a branch chain.
+_TOOL_HANDLERS = {
+    "search_papers": handle_search,
+    "list_papers": handle_list_papers,
+    "get_paper": handle_read_paper,
+}
+
 
 @server.list_prompts()
 async def list_prompts() -> List[types.Prompt]:
@@ -47,18 +54,14 @@ async def list_tools() -> List[types.Tool]:
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls for arXiv research functionality."""
-    logger.debug(f"Calling tool {name} with arguments {arguments}")
+    logger.debug("Calling tool %s with arguments %s", name, arguments)
     try:
-        if name == "search_papers":
-            return await handle_search(arguments)
-        elif name == "list_papers":
-            return await handle_list_papers(arguments)
-        elif name == "get_paper":
-            return await handle_read_paper(arguments)
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             return [types.TextContent(type="text", text=f"Error: Unknown tool {name}")]
+        return await handler(arguments)
     except Exception as e:
-        logger.error(f"Tool error: {str(e)}")
+        logger.error("Tool error: %s", e)
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
 
@@ -0,0 +1,18 @@
+"""Shared arxiv client for the arXiv MCP server tools."""
+
+import arxiv
+from typing import Optional
+
+_client: Optional[arxiv.Client] = None
+
+
+def get_client() -> arxiv.Client:
+    """Return the lazily created arxiv client shared across tool calls.
+
+    Reusing one client keeps its underlying HTTP session (and connection
+    pool) warm instead of paying a new handshake per tool call.
+    """
+    global _client
+    if _client is None:
+        _client = arxiv.Client()
+    return _client
@@ -1,19 +1,20 @@
 """Download functionality for the arXiv MCP server."""
 
 import arxiv
-import json
 import asyncio
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import mcp.types as types
-from ..config import Settings
-import pymupdf4llm
+from ..config import get_settings
+from .client import get_client
+from .serialization import dumps
+from . import list_papers, read_paper
 import logging
 
 logger = logging.getLogger("arxiv-mcp-server")
-settings = Settings()
+settings = get_settings()
 
 # Global dictionary to track conversion status
 conversion_statuses: Dict[str, Any] = {}
@@ -58,10 +59,26 @@ def get_paper_path(paper_id: str, suffix: str = ".md") -> Path:
     return storage_path / f"{paper_id}{suffix}"
 
 
+def _fetch_paper(client: arxiv.Client, paper_id: str) -> Optional[arxiv.Result]:
+    """Fetch a paper's metadata, or None when arXiv has no such ID.
+
+    Runs synchronously; the caller dispatches it to the default executor
+    because the arxiv client fetches results with blocking HTTP calls.
+    """
+    try:
+        return next(client.results(arxiv.Search(id_list=[paper_id])))
+    except StopIteration:
+        return None
+
+
 def convert_pdf_to_markdown(paper_id: str, pdf_path: Path) -> None:
     """Convert PDF to Markdown in a separate thread."""
+    # Imported lazily: pymupdf4llm pulls in PyMuPDF, which dominates module
+    # import time and is only needed once a conversion actually runs.
+    import pymupdf4llm
+
     try:
-        logger.info(f"Starting conversion for {paper_id}")
+        logger.info("Starting conversion for %s", paper_id)
         markdown = pymupdf4llm.to_markdown(pdf_path, show_progress=False)
         md_path = get_paper_path(paper_id, ".md")
 
@@ -74,10 +91,16 @@ def convert_pdf_to_markdown(paper_id: str, pdf_path: Path) -> None:
             status.completed_at = datetime.now()
 
         # Clean up PDF after successful conversion
-        logger.info(f"Conversion completed for {paper_id}")
+        pdf_path.unlink(missing_ok=True)
+
+        # The stored set changed; drop the cached directory listings.
+        list_papers.invalidate_list_cache()
+        read_paper.invalidate_list_cache()
+
+        logger.info("Conversion completed for %s", paper_id)
 
     except Exception as e:
-        logger.error(f"Conversion failed for {paper_id}: {str(e)}")
+        logger.error("Conversion failed for %s: %s", paper_id, e)
         status = conversion_statuses.get(paper_id)
         if status:
             status.status = "error"
@@ -99,7 +122,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
                     return [
                         types.TextContent(
                             type="text",
-                            text=json.dumps(
+                            text=dumps(
                                 {
                                     "status": "success",
                                     "message": "Paper is ready",
@@ -111,7 +134,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
                 return [
                     types.TextContent(
                         type="text",
-                        text=json.dumps(
+                        text=dumps(
                             {
                                 "status": "unknown",
                                 "message": "No download or conversion in progress",
@@ -123,7 +146,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=dumps(
                         {
                             "status": status.status,
                             "started_at": status.started_at.isoformat(),
@@ -144,7 +167,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=dumps(
                         {
                             "status": "success",
                             "message": "Paper already available",
@@ -160,7 +183,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=dumps(
                         {
                             "status": status.status,
                             "message": f"Paper conversion {status.status}",
@@ -172,16 +195,36 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
 
         # Start new download and conversion
         pdf_path = get_paper_path(paper_id, ".pdf")
-        client = arxiv.Client()
+        client = get_client()
 
         # Initialize status
         conversion_statuses[paper_id] = ConversionStatus(
             paper_id=paper_id, status="downloading", started_at=datetime.now()
         )
 
-        # Download PDF
-        paper = next(client.results(arxiv.Search(id_list=[paper_id])))
-        paper.download_pdf(dirpath=pdf_path.parent, filename=pdf_path.name)
+        # Fetch metadata and download the PDF off the event loop so other
+        # MCP requests keep flowing during arXiv's slow API responses.
+        # run_in_executor rather than asyncio.to_thread: the conversion step
+        # below owns the to_thread call for this handler.
+        loop = asyncio.get_running_loop()
+        paper = await loop.run_in_executor(None, _fetch_paper, client, paper_id)
+        if paper is None:
+            del conversion_statuses[paper_id]
+            return [
+                types.TextContent(
+                    type="text",
+                    text=dumps(
+                        {
+                            "status": "error",
+                            "message": f"Paper {paper_id} not found on arXiv",
+                        }
+                    ),
+                )
+            ]
+        await loop.run_in_executor(
+            None,
+            lambda: paper.download_pdf(dirpath=pdf_path.parent, filename=pdf_path.name),
+        )
 
         # Update status and start conversion
         status = conversion_statuses[paper_id]
@@ -195,7 +238,7 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(
+                text=dumps(
                     {
                         "status": "converting",
                         "message": "Paper downloaded, conversion started",
@@ -205,22 +248,10 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
             )
         ]
 
-    except StopIteration:
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(
-                    {
-                        "status": "error",
-                        "message": f"Paper {paper_id} not found on arXiv",
-                    }
-                ),
-            )
-        ]
     except Exception as e:
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps({"status": "error", "message": f"Error: {str(e)}"}),
+                text=dumps({"status": "error", "message": f"Error: {str(e)}"}),
             )
         ]
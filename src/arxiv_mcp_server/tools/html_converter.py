@@ -2,89 +2,212 @@
 
 import asyncio
 import logging
+import aiohttp
+import aiofiles
 from pathlib import Path
 from typing import Optional, Tuple
-import requests
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
-import ssl
-import urllib3
-from urllib3.util.ssl_ import create_urllib3_context
+from bs4 import BeautifulSoup, SoupStrainer
+from markdownify import MarkdownConverter
+import re
+
+try:
+    # Optional C-based HTML parser; 10-20x faster than BeautifulSoup with
+    # html.parser on large arXiv pages.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # lxml is a 3-5x faster BeautifulSoup backend than html.parser.
+    import lxml  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
 
 logger = logging.getLogger("arxiv-mcp-server")
 
-# Configure to handle SSL issues in some environments
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Bound concurrent fetches against arxiv.org; an MCP client fanning out
+# get_paper requests should queue here rather than trigger rate limiting.
+MAX_CONCURRENT_FETCHES = 8
+
+# Retry budget for 429 responses, with exponential backoff starting at 1s
+# (the Retry-After header takes precedence when arXiv sends one).
+MAX_FETCH_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0  # seconds
+
+_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+# Navigation/chrome elements stripped before markdown conversion.
+_NOISE_SELECTOR = (
+    "nav, header, footer, script, style, aside, "
+    "div.abs-nav, div.leftcolumn, div.rightcolumn"
+)
+
+# Restrict BeautifulSoup parsing to the main content div so the page chrome
+# never gets Python objects built for it in the first place.
+_MAIN_STRAINER = SoupStrainer("div", class_="ltx_page_main")
+
+# Strip per-line edge whitespace and collapse runs of blank lines in one
+# C-level pass instead of a Python loop over every line.
+_LINE_EDGE_WS_RE = re.compile(r"^[ \t]+|[ \t]+$", re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+# Markdown converter built once instead of per call; convert_soup lets the
+# BeautifulSoup path hand over its parsed tree directly instead of
+# serializing to HTML for markdownify to re-parse.
+_MD_CONVERTER = MarkdownConverter(
+    heading_style="ATX",  # Use # style headings
+    bullets="-",  # Use - for bullets
+    convert=[
+        "p",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "strong",
+        "em",
+        "ul",
+        "ol",
+        "li",
+        "blockquote",
+        "code",
+        "pre",
+    ],
+    escape_asterisks=False,
+    escape_underscores=False,
+)
 
 
 class ArxivHTMLConverter:
     """Converts arXiv HTML pages to Markdown format."""
 
-    def __init__(self):
-        """Initialize the converter with proper SSL context."""
-        # Create a custom SSL context that's more permissive
-        ctx = create_urllib3_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        self.session = requests.Session()
-        # Configure session for potential SSL issues
-        self.session.verify = False
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    # Shared across instances so every fetch reuses one keep-alive connection
+    # pool instead of paying a TCP+TLS handshake per paper.
+    _session: Optional[aiohttp.ClientSession] = None
+
+    _HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                # ssl=False keeps the permissive verification the old
+                # requests session used for environments with broken certs.
+                connector=aiohttp.TCPConnector(limit_per_host=8, ssl=False),
+                headers=cls._HEADERS,
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP session on server shutdown."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
 
     def _get_arxiv_html_url(self, paper_id: str) -> str:
         """Generate arXiv HTML URL from paper ID."""
         return f"https://arxiv.org/html/{paper_id}"
 
+    async def _fetch_html(self, url: str) -> str:
+        """GET a page under the fetch semaphore, retrying on rate limits.
+
+        A 429 response is retried up to MAX_FETCH_ATTEMPTS times, sleeping
+        for the server's Retry-After when present and falling back to
+        exponential backoff otherwise.
+        """
+        session = self._get_session()
+        async with _fetch_semaphore:
+            for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+                async with session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status == 429 and attempt < MAX_FETCH_ATTEMPTS:
+                        retry_after = response.headers.get("Retry-After", "")
+                        delay = (
+                            float(retry_after)
+                            if retry_after.isdigit()
+                            else RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
+                        )
+                        logger.warning(
+                            "Rate limited fetching %s; retrying in %.0fs", url, delay
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    response.raise_for_status()
+                    return await response.text()
+
     def _clean_html_content(self, soup: BeautifulSoup) -> BeautifulSoup:
         """Clean and extract the main content from arXiv HTML."""
         # Remove navigation, headers, footers, and other non-content elements
-        for element in soup(['nav', 'header', 'footer', 'script', 'style', 'aside']):
-            element.decompose()
-
-        # Remove specific arXiv navigation elements
-        for element in soup.find_all(['div'], class_=['abs-nav', 'leftcolumn', 'rightcolumn']):
+        # in one traversal; soupsieve caches the compiled selector.
+        for element in soup.select(_NOISE_SELECTOR):
             element.decompose()
 
         # Focus on the main content area
-        main_content = soup.find('div', class_='ltx_page_main') or soup.find('main') or soup.find('body')
+        main_content = (
+            soup.find("div", class_="ltx_page_main")
+            or soup.find("main")
+            or soup.find("body")
+        )
 
         if main_content:
             return main_content
         return soup
 
-    def _html_to_markdown(self, html_content: str) -> str:
-        """Convert HTML content to clean Markdown."""
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Clean the content
-        cleaned_soup = self._clean_html_content(soup)
-
-        # Convert to markdown with custom settings
-        markdown_content = md(
-            str(cleaned_soup),
-            heading_style="ATX",  # Use # style headings
-            bullets="-",  # Use - for bullets
-            convert=['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong',
-                     'em', 'ul', 'ol', 'li', 'blockquote', 'code', 'pre'],
-            escape_asterisks=False,
-            escape_underscores=False
-        )
-
-        # Clean up the markdown
-        lines = markdown_content.split('\n')
-        cleaned_lines = []
+    def _extract_main_html(self, html_content: str) -> str:
+        """Extract the main content subtree as an HTML string via lexbor.
 
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines that are too frequent
-            if line or (cleaned_lines and cleaned_lines[-1]):
-                cleaned_lines.append(line)
+        Only used when selectolax is installed; the BeautifulSoup fallback
+        goes through _extract_main_soup instead.
+        """
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css(_NOISE_SELECTOR):
+            node.decompose()
+        main = (
+            tree.css_first("div.ltx_page_main") or tree.css_first("main") or tree.body
+        )
+        if main is not None:
+            return main.html or ""
+        return tree.html or ""
+
+    def _extract_main_soup(self, html_content: str) -> BeautifulSoup:
+        """Parse and narrow to the main content as a BeautifulSoup tree."""
+        soup = BeautifulSoup(html_content, _BS4_PARSER, parse_only=_MAIN_STRAINER)
+        if soup.find(True) is None:
+            # Older arXiv HTML without ltx_page_main: parse the whole page.
+            soup = BeautifulSoup(html_content, _BS4_PARSER)
+            return self._clean_html_content(soup)
+
+        # Chrome elements mostly live outside ltx_page_main; drop any that
+        # made it into the strained subtree.
+        for element in soup.select(_NOISE_SELECTOR):
+            element.decompose()
+        return soup
 
-        return '\n'.join(cleaned_lines)
+    def _html_to_markdown(self, html_content: str) -> str:
+        """Convert HTML content to clean Markdown."""
+        # Narrow to the main content, then convert to markdown. The lexbor
+        # path hands markdownify a reduced HTML string; the BeautifulSoup
+        # path hands over its tree directly, skipping a serialize+re-parse.
+        if LexborHTMLParser is not None:
+            markdown_content = _MD_CONVERTER.convert(
+                self._extract_main_html(html_content)
+            )
+        else:
+            markdown_content = _MD_CONVERTER.convert_soup(
+                self._extract_main_soup(html_content)
+            )
+
+        # Clean up the markdown: trim each line and collapse blank-line runs
+        markdown_content = _LINE_EDGE_WS_RE.sub("", markdown_content)
+        return _BLANK_RUN_RE.sub("\n\n", markdown_content).strip("\n")
 
     async def fetch_paper_html(self, paper_id: str) -> Tuple[bool, str]:
         """
@@ -99,33 +222,38 @@ class ArxivHTMLConverter:
         """
         try:
             url = self._get_arxiv_html_url(paper_id)
-            logger.info(f"Fetching HTML for paper {paper_id} from {url}")
-
-            # Make the request in a thread to avoid blocking
-            def fetch():
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response.text
+            logger.info("Fetching HTML for paper %s from %s", paper_id, url)
 
-            html_content = await asyncio.to_thread(fetch)
+            html_content = await self._fetch_html(url)
 
             # Convert to markdown
-            markdown_content = await asyncio.to_thread(self._html_to_markdown, html_content)
+            markdown_content = await asyncio.to_thread(
+                self._html_to_markdown, html_content
+            )
 
             if not markdown_content.strip():
-                return False, f"Failed to extract content from HTML for paper {paper_id}"
-
-            logger.info(f"Successfully converted paper {paper_id} to markdown ({len(markdown_content)} chars)")
+                return (
+                    False,
+                    f"Failed to extract content from HTML for paper {paper_id}",
+                )
+
+            logger.info(
+                "Successfully converted paper %s to markdown (%d chars)",
+                paper_id,
+                len(markdown_content),
+            )
             return True, markdown_content
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error fetching paper {paper_id}: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Network error fetching paper %s: %s", paper_id, e)
             return False, f"Network error: {str(e)}"
         except Exception as e:
-            logger.error(f"Error processing paper {paper_id}: {str(e)}")
+            logger.error("Error processing paper %s: %s", paper_id, e)
             return False, f"Processing error: {str(e)}"
 
-    async def get_or_fetch_paper_content(self, paper_id: str, storage_path: Path) -> Tuple[bool, str]:
+    async def get_or_fetch_paper_content(
+        self, paper_id: str, storage_path: Path
+    ) -> Tuple[bool, str, bool]:
         """
         Get paper content from cache or fetch from arXiv HTML.
 
@@ -134,31 +262,35 @@ class ArxivHTMLConverter:
             storage_path: Path to storage directory
 
         Returns:
-            Tuple of (success: bool, content: str)
+            Tuple of (success: bool, content: str, from_cache: bool) where
+            from_cache reports whether a cached markdown file backs the
+            content, saving callers a redundant stat() to find out.
         """
         # Check if we have a cached version
         cached_file = storage_path / f"{paper_id}.md"
 
         if cached_file.exists():
             try:
-                async with asyncio.to_thread(open, cached_file, 'r', encoding='utf-8') as f:
-                    content = await asyncio.to_thread(f.read)
-                logger.info(f"Using cached content for paper {paper_id}")
-                return True, content
+                async with aiofiles.open(cached_file, "r", encoding="utf-8") as f:
+                    content = await f.read()
+                logger.info("Using cached content for paper %s", paper_id)
+                return True, content, True
             except Exception as e:
-                logger.warning(f"Error reading cached file for {paper_id}: {e}")
+                logger.warning("Error reading cached file for %s: %s", paper_id, e)
 
         # Fetch from arXiv HTML
         success, content = await self.fetch_paper_html(paper_id)
 
+        cached = False
         if success:
             # Cache the result
             try:
                 storage_path.mkdir(parents=True, exist_ok=True)
-                async with asyncio.to_thread(open, cached_file, 'w', encoding='utf-8') as f:
-                    await asyncio.to_thread(f.write, content)
-                logger.info(f"Cached content for paper {paper_id}")
+                async with aiofiles.open(cached_file, "w", encoding="utf-8") as f:
+                    await f.write(content)
+                logger.info("Cached content for paper %s", paper_id)
+                cached = True
             except Exception as e:
-                logger.warning(f"Error caching content for {paper_id}: {e}")
+                logger.warning("Error caching content for %s: %s", paper_id, e)
 
-        return success, content
+        return success, content, cached
@@ -1,13 +1,28 @@
 """List functionality for the arXiv MCP server."""
 
-import json
-from pathlib import Path
+import asyncio
+import os
+import time
 import arxiv
 from typing import Dict, Any, List, Optional
 import mcp.types as types
-from ..config import Settings
+from ..config import get_settings
+from .client import get_client
+from .serialization import dumps_indented
+
+settings = get_settings()
+
+# Short-lived cache of the storage directory scan; bursty listings reuse it
+# instead of re-reading the directory on every request.
+LIST_CACHE_TTL = 2.0  # seconds
+_list_cache: Optional[tuple[float, list[str]]] = None
+
+
+def invalidate_list_cache() -> None:
+    """Drop the cached directory scan (called after a paper is stored)."""
+    global _list_cache
+    _list_cache = None
 
-settings = Settings()
 
 list_tool = types.Tool(
     name="list_papers",
@@ -20,9 +35,31 @@ list_tool = types.Tool(
 )
 
 
+def _paper_to_dict(result: arxiv.Result) -> Dict[str, Any]:
+    """Build the response entry for a single paper."""
+    return {
+        "title": result.title,
+        "summary": result.summary,
+        "authors": [author.name for author in result.authors],
+        "links": [link.href for link in result.links],
+        "pdf_url": result.pdf_url,
+    }
+
+
 def list_papers() -> list[str]:
     """List all stored paper IDs."""
-    return [p.stem for p in Path(settings.STORAGE_PATH).glob("*.md")]
+    global _list_cache
+    now = time.monotonic()
+    if _list_cache is not None and now - _list_cache[0] < LIST_CACHE_TTL:
+        return list(_list_cache[1])
+
+    paper_ids = [
+        entry.name[:-3]
+        for entry in os.scandir(settings.STORAGE_PATH)
+        if entry.name.endswith(".md") and entry.is_file()
+    ]
+    _list_cache = (now, paper_ids)
+    return list(paper_ids)
 
 
 async def handle_list_papers(
@@ -32,27 +69,20 @@ async def handle_list_papers(
     try:
         papers = list_papers()
 
-        client = arxiv.Client()
+        client = get_client()
 
-        results = client.results(arxiv.Search(id_list=papers))
+        # The arxiv client fetches results with blocking HTTP calls, so
+        # materialize them in a thread instead of stalling the event loop.
+        results = await asyncio.to_thread(
+            lambda: list(client.results(arxiv.Search(id_list=papers)))
+        )
 
         response_data = {
             "total_papers": len(papers),
-            "papers": [
-                {
-                    "title": result.title,
-                    "summary": result.summary,
-                    "authors": [author.name for author in result.authors],
-                    "links": [link.href for link in result.links],
-                    "pdf_url": result.pdf_url,
-                }
-                for result in results
-            ],
+            "papers": [_paper_to_dict(result) for result in results],
         }
 
-        return [
-            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
-        ]
+        return [types.TextContent(type="text", text=dumps_indented(response_data))]
 
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
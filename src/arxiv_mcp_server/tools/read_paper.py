@@ -1,15 +1,49 @@
 """Get paper content functionality for the arXiv MCP server."""
 
-import json
-from pathlib import Path
-from typing import Dict, Any, List
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 import mcp.types as types
-from ..config import Settings
+from ..config import get_settings
 from .html_converter import ArxivHTMLConverter
+from .serialization import dumps
 
-settings = Settings()
+settings = get_settings()
 html_converter = ArxivHTMLConverter()
 
+# Recently read paper markdown, so repeat reads of the same paper skip the
+# disk read (or re-fetch) entirely. Entries are multi-megabyte, so keep the
+# cache small and evict least-recently-used.
+CONTENT_CACHE_MAX = 32
+_content_cache: OrderedDict[str, str] = OrderedDict()
+_content_cache_lock = asyncio.Lock()
+
+
+async def _cache_get(paper_id: str) -> str | None:
+    """Return cached markdown for paper_id, refreshing its recency."""
+    async with _content_cache_lock:
+        content = _content_cache.get(paper_id)
+        if content is not None:
+            _content_cache.move_to_end(paper_id)
+        return content
+
+
+async def _cache_put(paper_id: str, content: str) -> None:
+    """Store markdown for paper_id, evicting the least recently used."""
+    async with _content_cache_lock:
+        _content_cache[paper_id] = content
+        _content_cache.move_to_end(paper_id)
+        while len(_content_cache) > CONTENT_CACHE_MAX:
+            _content_cache.popitem(last=False)
+
+
+def clear_content_cache() -> None:
+    """Drop all cached paper content."""
+    _content_cache.clear()
+
+
 read_tool = types.Tool(
     name="get_paper",
     description="Get the full content of an arXiv paper in markdown format from HTML source",
@@ -26,9 +60,33 @@ read_tool = types.Tool(
 )
 
 
+# Short-lived cache of the storage directory scan, mirroring list_papers.py.
+LIST_CACHE_TTL = 2.0  # seconds
+_list_cache: Optional[tuple[float, list[str]]] = None
+
+
+def invalidate_list_cache() -> None:
+    """Drop the cached directory scan (called after a paper is stored)."""
+    global _list_cache
+    _list_cache = None
+
+
 def list_papers() -> list[str]:
     """List all cached paper IDs."""
-    return [p.stem for p in Path(settings.STORAGE_PATH).glob("*.md")]
+    global _list_cache
+    now = time.monotonic()
+    if _list_cache is not None and now - _list_cache[0] < LIST_CACHE_TTL:
+        return list(_list_cache[1])
+
+    # os.scandir avoids the per-entry Path construction and Python-level
+    # fnmatch that Path.glob pays.
+    paper_ids = [
+        entry.name[:-3]
+        for entry in os.scandir(settings.STORAGE_PATH)
+        if entry.name.endswith(".md") and entry.is_file()
+    ]
+    _list_cache = (now, paper_ids)
+    return list(paper_ids)
 
 
 async def handle_read_paper(arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -36,16 +94,24 @@ async def handle_read_paper(arguments: Dict[str, Any]) -> List[types.TextContent
     try:
         paper_id = arguments["paper_id"]
 
-        # Use the HTML converter to get paper content
-        success, content = await html_converter.get_or_fetch_paper_content(
-            paper_id, Path(settings.STORAGE_PATH)
-        )
+        cached_content = await _cache_get(paper_id)
+        if cached_content is not None:
+            success, content, from_cache = True, cached_content, True
+        else:
+            # Use the HTML converter to get paper content
+            success, content, from_cache = (
+                await html_converter.get_or_fetch_paper_content(
+                    paper_id, settings.STORAGE_PATH
+                )
+            )
+            if success:
+                await _cache_put(paper_id, content)
 
         if not success:
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=dumps(
                         {
                             "status": "error",
                             "message": f"Failed to get paper {paper_id}: {content}",
@@ -57,13 +123,13 @@ async def handle_read_paper(arguments: Dict[str, Any]) -> List[types.TextContent
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(
+                text=dumps(
                     {
                         "status": "success",
                         "paper_id": paper_id,
                         "content": content,
                         "source": "arXiv HTML",
-                        "cached": Path(settings.STORAGE_PATH, f"{paper_id}.md").exists()
+                        "cached": from_cache,
                     }
                 ),
             )
@@ -73,7 +139,7 @@ async def handle_read_paper(arguments: Dict[str, Any]) -> List[types.TextContent
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(
+                text=dumps(
                     {
                         "status": "error",
                         "message": f"Error getting paper: {str(e)}",
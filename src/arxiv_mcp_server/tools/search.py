@@ -1,14 +1,111 @@
 """Search functionality for the arXiv MCP server."""
 
 import arxiv
-import json
-from typing import Dict, Any, List
+import asyncio
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from dateutil import parser
 import mcp.types as types
-from ..config import Settings
+from ..config import get_settings
+from .client import get_client
+from .serialization import dumps_indented
+
+settings = get_settings()
+
+# Recent search responses keyed on the request arguments. arXiv metadata is
+# effectively immutable on this timescale, so identical queries within the
+# TTL reuse the rendered response instead of hitting the API again.
+SEARCH_CACHE_TTL = 300  # seconds
+SEARCH_CACHE_MAX = 128
+_search_cache: Dict[Tuple, Tuple[float, str]] = {}
+
+
+def _cache_key(arguments: Dict[str, Any], max_results: int) -> Tuple:
+    """Build a hashable cache key from the search arguments."""
+    return (
+        arguments["query"],
+        max_results,
+        arguments.get("date_from"),
+        arguments.get("date_to"),
+        tuple(arguments.get("categories") or ()),
+    )
+
+
+def _cache_get(key: Tuple) -> Optional[str]:
+    """Return the cached response text for key, or None if absent/expired."""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, text = entry
+    if time.monotonic() >= expires_at:
+        del _search_cache[key]
+        return None
+    return text
+
+
+def _cache_put(key: Tuple, text: str) -> None:
+    """Store a response, evicting the oldest entry when over capacity."""
+    while len(_search_cache) >= SEARCH_CACHE_MAX:
+        del _search_cache[next(iter(_search_cache))]
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, text)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search responses."""
+    _search_cache.clear()
+
+
+@lru_cache(maxsize=256)
+def _compose_query(query: str, categories: Tuple[str, ...]) -> str:
+    """Compose the final arxiv query string, memoized per (query, categories).
+
+    Adds a field specifier to plain queries for better relevance (issue #33,
+    where queries sorted by date returned irrelevant results) and appends the
+    category filter.
+    """
+    # Add field specifier if not already present
+    # This ensures the query actually searches the content
+    if not any(field in query for field in ["all:", "ti:", "abs:", "au:", "cat:"]):
+        # Convert plain query to use all: field for better results
+        # Handle quoted phrases
+        if '"' in query:
+            # Keep quoted phrases intact
+            query = f"all:{query}"
+        else:
+            # For unquoted multi-word queries, use AND operator
+            terms = query.split()
+            if len(terms) > 1:
+                query = " AND ".join(f"all:{term}" for term in terms)
+            else:
+                query = f"all:{query}"
+
+    if categories:
+        category_filter = " OR ".join(f"cat:{cat}" for cat in categories)
+        query = f"({query}) AND ({category_filter})"
+
+    return query
+
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(T.*)?")
+
+
+@lru_cache(maxsize=256)
+def _parse_date(value: str) -> datetime:
+    """Parse a date string, memoized since clients repeat the same bounds.
+
+    ISO 8601 inputs take the much faster datetime.fromisoformat path;
+    anything else falls back to dateutil's general parser.
+    """
+    if _ISO_DATE_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return parser.parse(value)
 
-settings = Settings()
 
 search_tool = types.Tool(
     name="search_papers",
@@ -43,6 +140,38 @@ def _is_within_date_range(
     return True
 
 
+def _collect_results(
+    client: arxiv.Client,
+    search: arxiv.Search,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    max_results: int,
+) -> List[Dict[str, Any]]:
+    """Iterate search results with date filtering, up to max_results.
+
+    Runs synchronously; the caller dispatches it to a thread because the
+    arxiv client fetches result pages with blocking HTTP calls.
+    """
+    if date_from and not date_from.tzinfo:
+        date_from = date_from.replace(tzinfo=timezone.utc)
+
+    results = []
+    for paper in client.results(search):
+        # Results come back newest-first (SortCriterion.SubmittedDate), so
+        # once a paper predates date_from every remaining one does too and
+        # fetching further pages is wasted round trips.
+        if date_from and paper.published < date_from:
+            break
+
+        if _is_within_date_range(paper.published, date_from, date_to):
+            results.append(_process_paper(paper))
+
+        if len(results) >= max_results:
+            break
+
+    return results
+
+
 def _process_paper(paper: arxiv.Result) -> Dict[str, Any]:
     """Process paper information with resource URI."""
     return {
@@ -64,31 +193,17 @@ async def handle_search(arguments: Dict[str, Any]) -> List[types.TextContent]:
     This fixes issue #33 where queries sorted by date returned irrelevant results.
     """
     try:
-        client = arxiv.Client()
+        client = get_client()
         max_results = min(int(arguments.get("max_results", 10)), settings.MAX_RESULTS)
 
-        # Build search query with category filtering
-        query = arguments["query"]
-
-        # Add field specifier if not already present
-        # This ensures the query actually searches the content
-        if not any(field in query for field in ["all:", "ti:", "abs:", "au:", "cat:"]):
-            # Convert plain query to use all: field for better results
-            # Handle quoted phrases
-            if '"' in query:
-                # Keep quoted phrases intact
-                query = f"all:{query}"
-            else:
-                # For unquoted multi-word queries, use AND operator
-                terms = query.split()
-                if len(terms) > 1:
-                    query = " AND ".join(f"all:{term}" for term in terms)
-                else:
-                    query = f"all:{query}"
+        cache_key = _cache_key(arguments, max_results)
+        if (cached := _cache_get(cache_key)) is not None:
+            return [types.TextContent(type="text", text=cached)]
 
-        if categories := arguments.get("categories"):
-            category_filter = " OR ".join(f"cat:{cat}" for cat in categories)
-            query = f"({query}) AND ({category_filter})"
+        # Build search query with category filtering
+        query = _compose_query(
+            arguments["query"], tuple(arguments.get("categories") or ())
+        )
 
         search = arxiv.Search(
             query=query,
@@ -97,15 +212,14 @@ async def handle_search(arguments: Dict[str, Any]) -> List[types.TextContent]:
         )
 
         # Process results with date filtering
-        results = []
         try:
             date_from = (
-                parser.parse(arguments["date_from"]).replace(tzinfo=timezone.utc)
+                _parse_date(arguments["date_from"]).replace(tzinfo=timezone.utc)
                 if "date_from" in arguments
                 else None
             )
             date_to = (
-                parser.parse(arguments["date_to"]).replace(tzinfo=timezone.utc)
+                _parse_date(arguments["date_to"]).replace(tzinfo=timezone.utc)
                 if "date_to" in arguments
                 else None
             )
@@ -116,18 +230,15 @@ async def handle_search(arguments: Dict[str, Any]) -> List[types.TextContent]:
                 )
             ]
 
-        for paper in client.results(search):
-            if _is_within_date_range(paper.published, date_from, date_to):
-                results.append(_process_paper(paper))
-
-            if len(results) >= max_results:
-                break
+        results = await asyncio.to_thread(
+            _collect_results, client, search, date_from, date_to, max_results
+        )
 
         response_data = {"total_results": len(results), "papers": results}
+        response_text = dumps_indented(response_data)
+        _cache_put(cache_key, response_text)
 
-        return [
-            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
-        ]
+        return [types.TextContent(type="text", text=response_text)]
 
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
@@ -0,0 +1,31 @@
+"""JSON serialization helpers for tool responses."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any) -> str:
+    """Serialize a tool response to compact JSON.
+
+    json.dumps escapes in pure Python, which shows up on the multi-megabyte
+    content strings get_paper returns; orjson does the same work in C.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def dumps_indented(data: Any) -> str:
+    """Serialize a tool response to indented JSON.
+
+    Uses orjson when it is installed (2-10x faster than the stdlib for the
+    paper lists these responses carry) and falls back to json otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
@@ -1,12 +1,38 @@
 """Shared test fixtures for the arXiv MCP server test suite."""
 
+import asyncio
 import pytest
-import tempfile
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, AsyncMock
 import arxiv
 from pathlib import Path
 
+try:
+    # Optional (speed extra): cuts per-await scheduling overhead across the
+    # all-async suite, and exercises the loop the server itself prefers.
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    """Reset the cached arxiv client and tool caches between tests."""
+    from arxiv_mcp_server.tools import client, list_papers, read_paper, search
+
+    def _reset():
+        client._client = None
+        search.clear_search_cache()
+        list_papers.invalidate_list_cache()
+        read_paper.invalidate_list_cache()
+        read_paper.clear_content_cache()
+
+    _reset()
+    yield
+    _reset()
+
 
 class MockAuthor:
     def __init__(self, name):
@@ -18,9 +44,14 @@ class MockLink:
         self.href = href
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_paper():
-    """Create a properly structured mock paper with all required attributes."""
+    """Create a properly structured mock paper with all required attributes.
+
+    Session-scoped: building a MagicMock against the arxiv.Result spec is
+    comparatively expensive, no test mutates the paper, and the handlers
+    only ever read from it.
+    """
     paper = MagicMock(spec=arxiv.Result)
     paper.get_short_id.return_value = "2103.12345"
     paper.title = "Test Paper"
@@ -45,10 +76,19 @@ def mock_client(mock_paper):
 
 
 @pytest.fixture
-def temp_storage_path():
-    """Create a temporary directory for paper storage during tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_storage_path(tmp_path, monkeypatch):
+    """Redirect paper storage to a temporary directory for the test.
+
+    Shadowing the STORAGE_PATH property on the class keeps every handler
+    that reads settings.STORAGE_PATH inside the temp directory, so tests
+    never touch the real storage dir and xdist workers cannot collide.
+    pytest manages the directory's lifetime, so no explicit cleanup walk
+    runs after each test.
+    """
+    from arxiv_mcp_server.config import Settings
+
+    monkeypatch.setattr(Settings, "STORAGE_PATH", tmp_path)
+    return tmp_path
 
 
 @pytest.fixture
@@ -0,0 +1,22 @@
+"""Microbenchmarks guarding the hot search-result helpers against regressions."""
+
+import pytest
+from datetime import datetime, timezone
+from arxiv_mcp_server.tools.search import _is_within_date_range, _process_paper
+
+_DATE = datetime(2023, 1, 1, tzinfo=timezone.utc)
+_START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+_END = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.benchmark(disable_gc=True, warmup=True)
+def test_bench_is_within_date_range(benchmark):
+    """Benchmark the per-paper date-range filter."""
+    assert benchmark(_is_within_date_range, _DATE, _START, _END) is True
+
+
+@pytest.mark.benchmark(disable_gc=True, warmup=True)
+def test_bench_process_paper(benchmark, mock_paper):
+    """Benchmark the per-paper response-dict construction."""
+    result = benchmark(_process_paper, mock_paper)
+    assert result["id"] == "2103.12345"
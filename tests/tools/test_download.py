@@ -1,7 +1,6 @@
 """Tests for paper download functionality."""
 
 import pytest
-import json
 from datetime import datetime
 from arxiv_mcp_server.tools.download import (
     handle_download,
@@ -9,6 +8,12 @@ from arxiv_mcp_server.tools.download import (
     conversion_statuses,
 )
 
+try:
+    # Optional (speed extra): C-level JSON decoding for response payloads.
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 
 @pytest.mark.asyncio
 async def test_download_paper_lifecycle(mocker, temp_storage_path):
@@ -33,12 +38,12 @@ async def test_download_paper_lifecycle(mocker, temp_storage_path):
 
     # Initial download request
     response = await handle_download({"paper_id": paper_id})
-    status = json.loads(response[0].text)
+    status = loads(response[0].text)
     assert status["status"] in ["converting", "success"]
 
     # Check final status
     response = await handle_download({"paper_id": paper_id, "check_status": True})
-    final_status = json.loads(response[0].text)
+    final_status = loads(response[0].text)
     assert final_status["status"] in ["success", "converting"]
 
     # Verify markdown file exists
@@ -58,7 +63,7 @@ async def test_download_existing_paper(temp_storage_path):
         f.write("# Existing Paper\nTest content")
 
     response = await handle_download({"paper_id": paper_id})
-    status = json.loads(response[0].text)
+    status = loads(response[0].text)
     assert status["status"] == "success"
 
 
@@ -68,7 +73,7 @@ async def test_download_nonexistent_paper(mocker):
     mocker.patch("arxiv.Client.results", side_effect=StopIteration())
 
     response = await handle_download({"paper_id": "invalid.12345"})
-    status = json.loads(response[0].text)
+    status = loads(response[0].text)
     assert status["status"] == "error"
     assert "not found on arXiv" in status["message"]
 
@@ -77,5 +82,5 @@ async def test_download_nonexistent_paper(mocker):
 async def test_check_unknown_status():
     """Test checking status of unknown paper."""
     response = await handle_download({"paper_id": "2103.99999", "check_status": True})
-    status = json.loads(response[0].text)
+    status = loads(response[0].text)
     assert status["status"] == "unknown"
@@ -1,83 +1,141 @@
 """Tests for paper search functionality."""
 
 import pytest
-import json
+from datetime import datetime, timezone
 from unittest.mock import patch
+import arxiv
 from arxiv_mcp_server.tools import handle_search
+from arxiv_mcp_server.tools.search import _is_within_date_range, _parse_date
+
+try:
+    # Optional (speed extra): C-level JSON decoding for response payloads.
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Fixed probe date for the date-range cases below.
+_DATE = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _patch_arxiv_client(mock_client, monkeypatch):
+    """Route every arxiv.Client() construction to the shared mock.
+
+    monkeypatch.setattr swaps one module attribute instead of the
+    sys.modules walk mock.patch performs per with-block.
+    """
+    monkeypatch.setattr(arxiv, "Client", lambda *args, **kwargs: mock_client)
 
 
 @pytest.mark.asyncio
-async def test_basic_search(mock_client):
+async def test_basic_search():
     """Test basic paper search functionality."""
-    with patch("arxiv.Client", return_value=mock_client):
-        result = await handle_search({"query": "test query", "max_results": 1})
+    result = await handle_search({"query": "test query", "max_results": 1})
 
-        assert len(result) == 1
-        content = json.loads(result[0].text)
-        assert content["total_results"] == 1
-        paper = content["papers"][0]
-        assert paper["id"] == "2103.12345"
-        assert paper["title"] == "Test Paper"
-        assert "resource_uri" in paper
+    assert len(result) == 1
+    content = loads(result[0].text)
+    assert content["total_results"] == 1
+    paper = content["papers"][0]
+    assert paper["id"] == "2103.12345"
+    assert paper["title"] == "Test Paper"
+    assert "resource_uri" in paper
 
 
 @pytest.mark.asyncio
-async def test_search_with_categories(mock_client):
+async def test_search_with_categories():
     """Test paper search with category filtering."""
-    with patch("arxiv.Client", return_value=mock_client):
-        result = await handle_search(
-            {"query": "test query", "categories": ["cs.AI", "cs.LG"], "max_results": 1}
-        )
+    result = await handle_search(
+        {"query": "test query", "categories": ["cs.AI", "cs.LG"], "max_results": 1}
+    )
 
-        content = json.loads(result[0].text)
-        assert content["papers"][0]["categories"] == ["cs.AI", "cs.LG"]
+    content = loads(result[0].text)
+    assert content["papers"][0]["categories"] == ["cs.AI", "cs.LG"]
 
 
 @pytest.mark.asyncio
-async def test_search_with_dates(mock_client):
+async def test_search_with_dates():
     """Test paper search with date filtering."""
-    with patch("arxiv.Client", return_value=mock_client):
-        result = await handle_search(
-            {
-                "query": "test query",
-                "date_from": "2022-01-01",
-                "date_to": "2024-01-01",
-                "max_results": 1,
-            }
-        )
+    result = await handle_search(
+        {
+            "query": "test query",
+            "date_from": "2022-01-01",
+            "date_to": "2024-01-01",
+            "max_results": 1,
+        }
+    )
 
-        content = json.loads(result[0].text)
-        assert content["total_results"] == 1
-        assert len(content["papers"]) == 1
+    content = loads(result[0].text)
+    assert content["total_results"] == 1
+    assert len(content["papers"]) == 1
 
 
 @pytest.mark.asyncio
-async def test_search_with_invalid_dates(mock_client):
+async def test_search_with_invalid_dates():
     """Test search with invalid date formats."""
-    with patch("arxiv.Client", return_value=mock_client):
-        result = await handle_search(
-            {"query": "test query", "date_from": "invalid-date", "max_results": 1}
-        )
+    result = await handle_search(
+        {"query": "test query", "date_from": "invalid-date", "max_results": 1}
+    )
 
-        assert result[0].text.startswith("Error: Invalid date format")
+    assert result[0].text.startswith("Error: Invalid date format")
 
 
 @pytest.mark.asyncio
-async def test_search_query_field_specifier_fix(mock_client):
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        # Multi-word query
+        ("quantum computing", "all:quantum AND all:computing"),
+        # Single word query
+        ("transformer", "all:transformer"),
+        # Query with existing field specifier (should not be modified)
+        ("ti:neural networks", "ti:neural networks"),
+    ],
+)
+async def test_search_query_field_specifier_fix(query, expected):
     """Test that plain queries get field specifiers for better relevance (issue #33)."""
-    with patch("arxiv.Client", return_value=mock_client):
-        with patch("arxiv.Search") as search_mock:
-            # Test multi-word query
-            await handle_search({"query": "quantum computing", "max_results": 1})
-            search_mock.assert_called()
-            assert search_mock.call_args[1]["query"] == "all:quantum AND all:computing"
-
-            # Test single word query
-            search_mock.reset_mock()
-            await handle_search({"query": "transformer", "max_results": 1})
-            assert search_mock.call_args[1]["query"] == "all:transformer"
-
-            # Test query with existing field specifier (should not be modified)
-            search_mock.reset_mock()
-            await handle_search({"query": "ti:neural networks", "max_results": 1})
-            assert search_mock.call_args[1]["query"] == "ti:neural networks"
+    with patch("arxiv.Search") as search_mock:
+        await handle_search({"query": query, "max_results": 1})
+        search_mock.assert_called()
+        assert search_mock.call_args[1]["query"] == expected
+
+
+@pytest.mark.parametrize(
+    "start,end,expected",
+    [
+        # No bounds
+        (None, None, True),
+        # Inside both bounds
+        (
+            datetime(2022, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            True,
+        ),
+        # Only a start bound, satisfied
+        (datetime(2022, 1, 1, tzinfo=timezone.utc), None, True),
+        # Start bound after the date
+        (datetime(2023, 6, 1, tzinfo=timezone.utc), None, False),
+        # End bound before the date
+        (None, datetime(2022, 6, 1, tzinfo=timezone.utc), False),
+        # Naive bounds are treated as UTC
+        (datetime(2022, 1, 1), datetime(2024, 1, 1), True),
+    ],
+)
+def test_is_within_date_range(start, end, expected):
+    """Test date-range filtering across bound combinations."""
+    assert _is_within_date_range(_DATE, start, end) is expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        # Plain ISO date takes the fromisoformat fast path
+        ("2023-01-15", datetime(2023, 1, 15)),
+        # ISO date-time likewise
+        ("2023-01-15T12:30:00", datetime(2023, 1, 15, 12, 30)),
+        # Anything else falls back to dateutil's general parser
+        ("Jan 15 2023", datetime(2023, 1, 15)),
+    ],
+)
+def test_parse_date(value, expected):
+    """Test date parsing on both the ISO fast path and the dateutil fallback."""
+    assert _parse_date(value) == expected